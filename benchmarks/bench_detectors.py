@@ -0,0 +1,80 @@
+"""Benchmark meeting detection on recorded browser-heavy window lists.
+
+Usage:
+    python -m benchmarks.bench_detectors [--iterations N]
+
+Compares the browser detector's literal prefilter and verdict cache
+against running its regexes over every title, and times a full poll
+with all detectors enabled.
+"""
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+from meeting_status.detectors import BrowserDetector, TeamsDetector, ZoomDetector
+from meeting_status.platforms.base import WindowInfo
+
+DATA_FILE = Path(__file__).parent / "data" / "browser_windows.json"
+
+
+class RegexOnlyBrowserDetector(BrowserDetector):
+    """BrowserDetector without the prefilter or cache, as a baseline."""
+
+    def is_meeting_title(self, title: str) -> bool:
+        return any(regex.search(title) for regex in self._meeting_regexes)
+
+
+def load_snapshots(path: Path) -> list[list[WindowInfo]]:
+    """Load recorded window lists (one list per poll)."""
+    with open(path) as f:
+        return [[WindowInfo(**w) for w in snapshot] for snapshot in json.load(f)]
+
+
+def time_polls(detectors, snapshots, iterations: int) -> tuple[float, list[bool]]:
+    """Return mean microseconds per poll and the verdict for each snapshot."""
+    verdicts = [any(d.is_in_meeting(s) for d in detectors) for s in snapshots]
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for snapshot in snapshots:
+            for detector in detectors:
+                if detector.is_in_meeting(snapshot):
+                    break
+    elapsed = time.perf_counter() - start
+
+    return elapsed / (iterations * len(snapshots)) * 1e6, verdicts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--data", type=Path, default=DATA_FILE)
+    args = parser.parse_args()
+
+    snapshots = load_snapshots(args.data)
+    windows = sum(len(s) for s in snapshots)
+    print(f"{len(snapshots)} recorded polls, {windows / len(snapshots):.0f} windows per poll")
+
+    # Make sure the re module's own pattern cache isn't what we measure
+    re.purge()
+
+    results = {}
+    for label, detectors in [
+        ("browser, regex only", [RegexOnlyBrowserDetector()]),
+        ("browser, prefilter + cache", [BrowserDetector()]),
+        ("teams + zoom + browser", [TeamsDetector(), ZoomDetector(), BrowserDetector()]),
+    ]:
+        per_poll, verdicts = time_polls(detectors, snapshots, args.iterations)
+        results[label] = verdicts
+        meetings = sum(verdicts)
+        print(f"{label:30s} {per_poll:8.1f} us/poll  ({meetings} polls in meeting)")
+
+    if results["browser, regex only"] != results["browser, prefilter + cache"]:
+        raise SystemExit("Prefiltered verdicts differ from regex-only verdicts")
+
+
+if __name__ == "__main__":
+    main()
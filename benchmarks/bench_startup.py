@@ -0,0 +1,178 @@
+"""Benchmark agent startup: import time and time to first status.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs N] [--latency SECONDS]
+
+Import time is measured in fresh interpreters. Time to first status runs
+"python -m meeting_status --once" and the polling daemon against a local
+fake Home Assistant that answers after --latency seconds. Fake wmctrl
+and xdotool on PATH replay a recorded window list (xdotool with one
+process per window property, like the real one), so the benchmark runs
+without an X server (Linux only). It reports when the first status is
+decided and when it has been delivered.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.fake_homeassistant import FakeHomeAssistant
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+WINDOWS_FILE = Path(__file__).parent / "data" / "browser_windows.json"
+
+
+def write_fake_wmctrl(directory: Path) -> None:
+    """Write a wmctrl stand-in that prints a recorded window list."""
+    with open(WINDOWS_FILE) as f:
+        windows = json.load(f)[0]
+    lines = [
+        f"0x{i:08x}  0 {os.getpid()} bench {w['title']}"
+        for i, w in enumerate(windows)
+    ]
+    script = directory / "wmctrl"
+    script.write_text("#!/bin/sh\ncat <<'EOF'\n" + "\n".join(lines) + "\nEOF\n")
+    script.chmod(0o755)
+
+
+def write_fake_xdotool(directory: Path) -> None:
+    """Write an xdotool stand-in serving the same recorded window list."""
+    with open(WINDOWS_FILE) as f:
+        windows = json.load(f)[0]
+    titles = directory / "xdotool-titles"
+    titles.write_text("".join(f"{w['title']}\n" for w in windows))
+    script = directory / "xdotool"
+    script.write_text(
+        "#!/bin/sh\n"
+        'case "$1" in\n'
+        f"  search) seq 1 {len(windows)} ;;\n"
+        f'  getwindowname) sed -n "$2p" {shlex.quote(str(titles))} ;;\n'
+        f"  getwindowpid) echo {os.getpid()} ;;\n"
+        "esac\n"
+    )
+    script.chmod(0o755)
+
+
+def measure_import(runs: int) -> list[float]:
+    """Return seconds to import meeting_status.__main__ in fresh interpreters."""
+    code = (
+        "import time; t = time.perf_counter(); import meeting_status.__main__; "
+        "print(time.perf_counter() - t)"
+    )
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        results.append(float(out.stdout.strip()))
+    return results
+
+
+def measure_first_status(
+    env: dict[str, str],
+    server: FakeHomeAssistant,
+    once: bool,
+) -> tuple[float, float]:
+    """Run one --once invocation, or start the daemon until it delivers.
+
+    Returns:
+        (seconds until the first status was decided, seconds until the
+        --once run exited / the daemon's first status reached Home Assistant)
+    """
+    applied = server.counts["applied"]
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "meeting_status"] + (["--once"] if once else []),
+        cwd=REPO_ROOT, env=env, stderr=subprocess.PIPE, text=True,
+    )
+    first_status = None
+    for line in proc.stderr:
+        # "Initial status" is logged as soon as the first detection is done,
+        # before waiting for Home Assistant; older versions only log changes
+        if first_status is None and ("Initial status" in line or "Status changed" in line):
+            first_status = time.perf_counter() - start
+            if not once:
+                break
+
+    if once:
+        proc.wait()
+        total = time.perf_counter() - start
+        failed = proc.returncode != 0
+    else:
+        deadline = start + 30
+        while server.counts["applied"] == applied and time.perf_counter() < deadline:
+            time.sleep(0.001)
+        total = time.perf_counter() - start
+        failed = server.counts["applied"] == applied
+        proc.terminate()
+        proc.communicate()
+
+    if failed or first_status is None:
+        mode = "--once" if once else "daemon"
+        raise SystemExit(f"meeting_status {mode} failed (exit code {proc.returncode})")
+    return first_status, total
+
+
+def summarize(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:28s} median {statistics.median(samples) * 1000:7.1f} ms  "
+        f"min {min(samples) * 1000:7.1f} ms  max {max(samples) * 1000:7.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--latency", type=float, default=0.2,
+        help="Fake Home Assistant response delay in seconds (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    summarize("import meeting_status", measure_import(args.runs))
+
+    if not sys.platform.startswith("linux"):
+        print("Skipping time to first status (needs Linux for the fake wmctrl)")
+        return
+
+    server = FakeHomeAssistant(latency=args.latency).start()
+
+    results = {True: ([], []), False: ([], [])}
+    with tempfile.TemporaryDirectory() as tmp:
+        bin_dir = Path(tmp) / "bin"
+        bin_dir.mkdir()
+        write_fake_wmctrl(bin_dir)
+        write_fake_xdotool(bin_dir)
+
+        for run in range(args.runs):
+            for once, (first, total) in results.items():
+                env = dict(
+                    os.environ,
+                    PATH=f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+                    HA_URL=server.url,
+                    HA_TOKEN="bench",
+                    # Fresh state file each run so every run checks and delivers
+                    XDG_CACHE_HOME=str(Path(tmp) / f"cache{run}-{once}"),
+                )
+                f, t = measure_first_status(env, server, once)
+                first.append(f)
+                total.append(t)
+
+    server.stop()
+    print(f"Fake Home Assistant latency: {args.latency * 1000:.0f} ms per request")
+    for once, (first, total) in results.items():
+        mode = "--once" if once else "daemon"
+        summarize(f"{mode}: time to first status", first)
+        summarize(f"{mode}: delivered status", total)
+
+
+if __name__ == "__main__":
+    main()
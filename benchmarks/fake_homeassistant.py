@@ -0,0 +1,133 @@
+"""Local fake Home Assistant with injectable latency, errors and resets."""
+
+import json
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like Home Assistant
+    # Headers and body are separate writes; with Nagle on, the body waits
+    # for the client's delayed ACK and every response gains ~40 ms
+    disable_nagle_algorithm = True
+
+    def _reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _reset(self) -> None:
+        """Drop the connection with a TCP RST instead of answering."""
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        self.close_connection = True
+
+    def do_GET(self):
+        fake = self.server.fake
+        fake.count("get")
+        fake.delay()
+        self._reply(200, b'{"message": "API running."}')
+
+    def do_POST(self):
+        fake = self.server.fake
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        fake.count("post")
+        fake.delay()
+
+        fault = fake.pick_fault()
+        if fault == "reset":
+            fake.count("resets")
+            self._reset()
+        elif fault == "error":
+            fake.count("errors")
+            self._reply(503, b'{"message": "Service unavailable"}')
+        else:
+            fake.apply(json.loads(json.loads(body)["payload"]))
+            self._reply(200, b"[]")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that time out or drop a pooled connection are expected
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FakeHomeAssistant:
+    """Threaded HTTP server that answers like Home Assistant's REST API.
+
+    Every request waits latency +/- jitter seconds. Each script call then
+    fails with a 503 with probability error_rate, or has its connection
+    reset with probability reset_rate. Only successful calls change the
+    applied LED sign payload.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        reset_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.reset_rate = reset_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {"get": 0, "post": 0, "errors": 0, "resets": 0, "applied": 0}
+        self.applied: Optional[dict] = None
+
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.fake = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "FakeHomeAssistant":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] += 1
+
+    def delay(self) -> None:
+        with self._lock:
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def pick_fault(self) -> Optional[str]:
+        """Return "reset", "error" or None for the current request."""
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.reset_rate:
+            return "reset"
+        if roll < self.reset_rate + self.error_rate:
+            return "error"
+        return None
+
+    def apply(self, payload: dict) -> None:
+        with self._lock:
+            self.applied = payload
+            self.counts["applied"] += 1
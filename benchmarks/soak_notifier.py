@@ -0,0 +1,192 @@
+"""Soak and fault-injection harness for the notifier and polling loop.
+
+Usage:
+    python -m benchmarks.soak_notifier [--transitions N] [--latency S]
+        [--jitter S] [--error-rate P] [--reset-rate P] [--timeout S]
+        [--max-p99-ms MS] [--max-requests-per-transition R]
+
+Starts a local fake Home Assistant with the given latency, 5xx rate and
+connection-reset rate, then drives HomeAssistantNotifier through
+thousands of meeting transitions. The transitions come from a scripted
+fake Platform, and each poll runs the polling loop's own detect_status()
+and update_status(), so change detection and retries behave exactly as
+in the agent. Polls are back to back.
+
+Reports delivery latency percentiles (from the poll that first saw a new
+state to its successful delivery), script calls per transition and
+whether Home Assistant ends in the correct state. Exits non-zero if the
+final state is wrong or a --max-* gate is exceeded.
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from typing import Optional
+
+from benchmarks.fake_homeassistant import FakeHomeAssistant
+from meeting_status.__main__ import detect_status, update_status
+from meeting_status.detectors import ZoomDetector
+from meeting_status.notifiers import HomeAssistantNotifier
+from meeting_status.platforms.base import Backend, Platform, WindowInfo
+
+MEETING_WINDOWS = [WindowInfo(title="Zoom Meeting", process_name="zoom")]
+IDLE_WINDOWS = [WindowInfo(title="Zoom Workplace", process_name="zoom")]
+
+
+class ScriptedPlatform(Platform):
+    """Platform whose window list follows a pre-generated meeting script."""
+
+    def __init__(self, script: list[bool]):
+        super().__init__()
+        self.script = script
+        self.position = 0
+
+    @property
+    def name(self) -> str:
+        return "scripted"
+
+    def _next_windows(self) -> list[WindowInfo]:
+        in_meeting = self.script[min(self.position, len(self.script) - 1)]
+        self.position += 1
+        return MEETING_WINDOWS if in_meeting else IDLE_WINDOWS
+
+    def get_backends(self) -> list[Backend]:
+        return [Backend("script", self._next_windows, lambda: True)]
+
+
+def make_script(transitions: int, seed: int) -> list[bool]:
+    """Return per-poll meeting states with the given number of transitions.
+
+    Each state holds for 1-3 polls, so some changes arrive while an
+    earlier delivery is still being retried.
+    """
+    rng = random.Random(seed)
+    script = []
+    state = False
+    for _ in range(transitions + 1):
+        script.extend([state] * rng.randint(1, 3))
+        state = not state
+    return script
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transitions", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.002, help="Base response delay (s)")
+    parser.add_argument("--jitter", type=float, default=0.001, help="Uniform +/- delay jitter (s)")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Probability of a 503")
+    parser.add_argument("--reset-rate", type=float, default=0.02, help="Probability of a connection reset")
+    parser.add_argument("--timeout", type=float, default=10, help="Notifier request timeout (s)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-p99-ms", type=float, help="Fail if p99 delivery latency exceeds this")
+    parser.add_argument(
+        "--max-requests-per-transition", type=float,
+        help="Fail if script calls per transition exceed this",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    # The notifier and loop log every failure; keep the report readable
+    logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.CRITICAL)
+
+    server = FakeHomeAssistant(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        reset_rate=args.reset_rate,
+        seed=args.seed,
+    ).start()
+
+    script = make_script(args.transitions, args.seed)
+    platform = ScriptedPlatform(script)
+    platform.is_available(measure=False)
+    detectors = [ZoomDetector()]
+    notifier = HomeAssistantNotifier(server.url, "soak-token", timeout=args.timeout)
+
+    previous_in_meeting: Optional[bool] = None
+    pending_since: Optional[float] = None  # When the undelivered state was first seen
+    latencies: list[float] = []
+    superseded = 0
+    failures = 0
+    polls = 0
+
+    # After the script ends the last state repeats until it is delivered
+    max_polls = len(script) * 50
+    start = time.perf_counter()
+    while polls < max_polls and (platform.position < len(script) or previous_in_meeting != script[-1]):
+        _, in_meeting = detect_status(platform, detectors)
+        polls += 1
+        now = time.perf_counter()
+        before = previous_in_meeting
+        previous_in_meeting = update_status(notifier, in_meeting, before)
+
+        # Only observe here; the delivery decisions are update_status()'s
+        if in_meeting == before:
+            if pending_since is not None:
+                # Flipped back before the other state was ever delivered
+                superseded += 1
+                pending_since = None
+            continue
+
+        if pending_since is None:
+            pending_since = now
+        if previous_in_meeting == in_meeting:
+            latencies.append(time.perf_counter() - pending_since)
+            pending_since = None
+        else:
+            failures += 1
+    elapsed = time.perf_counter() - start
+    server.stop()
+
+    expected = {"text": "MEET", "color": "red"} if script[-1] else {"text": "FREE", "color": "cyan"}
+    correct = server.applied == expected
+    # Changes in the script, plus the initial state
+    transitions = 1 + sum(1 for a, b in zip(script, script[1:]) if a != b)
+    posts = server.counts["post"]
+    per_transition = posts / transitions if transitions else 0.0
+
+    print(
+        f"Fake HA: latency {args.latency * 1000:.1f} ms +/- {args.jitter * 1000:.1f} ms, "
+        f"{args.error_rate:.0%} 5xx, {args.reset_rate:.0%} resets, timeout {args.timeout:g}s"
+    )
+    print(
+        f"{polls} polls, {transitions} transitions in {elapsed:.1f}s "
+        f"({len(latencies)} delivered, {superseded} superseded before delivery)"
+    )
+    print(
+        f"Script calls: {posts} ({per_transition:.2f} per transition); "
+        f"{server.counts['errors']} 5xx, {server.counts['resets']} resets, "
+        f"{failures} failed deliveries retried"
+    )
+    if latencies:
+        print(
+            "Delivery latency: "
+            f"p50 {percentile(latencies, 50) * 1000:.1f} ms, "
+            f"p90 {percentile(latencies, 90) * 1000:.1f} ms, "
+            f"p99 {percentile(latencies, 99) * 1000:.1f} ms, "
+            f"max {max(latencies) * 1000:.1f} ms, "
+            f"mean {statistics.mean(latencies) * 1000:.1f} ms"
+        )
+    print(f"Final state: {'correct' if correct else 'WRONG'} (HA shows {server.applied}, expected {expected})")
+
+    failed = not correct
+    if args.max_p99_ms is not None and latencies and percentile(latencies, 99) * 1000 > args.max_p99_ms:
+        print(f"FAIL: p99 delivery latency above {args.max_p99_ms} ms")
+        failed = True
+    if args.max_requests_per_transition is not None and per_transition > args.max_requests_per_transition:
+        print(f"FAIL: more than {args.max_requests_per_transition} script calls per transition")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,22 @@ import argparse
 import logging
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import Future
+from dataclasses import fields
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from .config import Config
-from .detectors import TeamsDetector, ZoomDetector
-from .platforms import get_platform
-from .notifiers import HomeAssistantNotifier
+from .platforms import Platform, ProcessExitWatcher, get_platform
+
+# Heavier modules (requests, tracemalloc, ctypes, mmap, ...) are imported
+# where they are first needed to keep startup fast
+if TYPE_CHECKING:
+    from .history import HistoryWriter
+    from .notifiers import HomeAssistantNotifier
+    from .state import DeliveredState, StateCache
 
 # Configure logging
 logging.basicConfig(
@@ -32,9 +41,12 @@ def signal_handler(signum, frame):
 
 def get_detectors(detector_names: list[str]) -> list:
     """Get detector instances for the specified names."""
+    from .detectors import BrowserDetector, TeamsDetector, ZoomDetector
+
     available_detectors = {
         "teams": TeamsDetector,
         "zoom": ZoomDetector,
+        "browser": BrowserDetector,
     }
 
     detectors = []
@@ -48,6 +60,284 @@ def get_detectors(detector_names: list[str]) -> list:
     return detectors
 
 
+def run_in_background(fn, *args) -> Future:
+    """Run fn(*args) on a daemon thread.
+
+    Unlike ThreadPoolExecutor workers, the thread is not joined at
+    interpreter exit, so sys.exit() on a startup error doesn't wait for
+    a slow Home Assistant check still in flight.
+
+    Returns:
+        Future for the result
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f"startup-{fn.__name__}", daemon=True).start()
+    return future
+
+
+def detect_status(platform: Platform, detectors: list) -> tuple[list, Optional[bool]]:
+    """Enumerate windows and check them against the detectors.
+
+    Returns:
+        (windows, True if any detector sees a meeting); the status is None
+        if the windows could not be enumerated
+    """
+    windows = platform.get_windows()
+    if windows is None:
+        logger.warning("Failed to enumerate windows, keeping previous status")
+        return [], None
+    logger.debug(f"Found {len(windows)} windows via {platform.backend_manager.active}")
+
+    for detector in detectors:
+        if detector.is_in_meeting(windows):
+            logger.debug(f"Meeting detected by {detector.name}")
+            return windows, True
+    return windows, False
+
+
+def deliver_status(notifier: Optional["HomeAssistantNotifier"], in_meeting: bool) -> bool:
+    """Send a changed status, or print it in dry-run mode.
+
+    Returns:
+        True if the status was delivered; False means retry on the next poll
+    """
+    status = "IN MEETING" if in_meeting else "NOT IN MEETING"
+    logger.info(f"Status changed: {status}")
+
+    if notifier is None:
+        print(f"[DRY RUN] Would send: {status}")
+        return True
+
+    if notifier.notify(in_meeting):
+        return True
+    logger.warning("Failed to send notification, will retry")
+    return False
+
+
+def update_status(
+    notifier: Optional["HomeAssistantNotifier"],
+    in_meeting: Optional[bool],
+    previous_in_meeting: Optional[bool],
+    state_cache: Optional["StateCache"] = None,
+    delivered: Optional["DeliveredState"] = None,
+) -> Optional[bool]:
+    """Send the status if it changed since the last delivery.
+
+    An unknown status (windows could not be enumerated) is never sent, and
+    a failed delivery keeps the previous status so it is retried on the
+    next poll.
+
+    Args:
+        notifier: Home Assistant notifier, or None for dry run
+        in_meeting: Status from detect_status()
+        previous_in_meeting: Last delivered status
+        state_cache: Locked state cache for --once runs, or None
+        delivered: Delivered state loaded from the state cache, if any
+
+    Returns:
+        The last delivered status after this poll
+    """
+    if in_meeting is None or in_meeting == previous_in_meeting:
+        return previous_in_meeting
+
+    if delivered and not check_connection(notifier, state_cache, delivered):
+        sys.exit(1)
+
+    if not deliver_status(notifier, in_meeting):
+        return previous_in_meeting
+
+    if state_cache:
+        from .state import DeliveredState
+
+        state_cache.save(DeliveredState(
+            in_meeting=in_meeting,
+            target=notifier.service_url,
+            timestamp=time.time(),
+        ))
+    return in_meeting
+
+
+def init_platform() -> tuple[Platform, bool]:
+    """Create the platform for this OS and check its backends.
+
+    Backends are only checked for availability and kept in preference
+    order, so the first status isn't held up by a trial enumeration per
+    backend; the polling loop times them after the first status.
+
+    Returns:
+        The platform and whether it is available
+    """
+    platform = get_platform()
+    logger.info(f"Using platform: {platform.name}")
+    return platform, platform.is_available(measure=False)
+
+
+def connect_notifier(
+    config: Config,
+    pool_size: Optional[int],
+    state_cache: Optional["StateCache"],
+) -> tuple[Optional["HomeAssistantNotifier"], Optional["DeliveredState"]]:
+    """Create the Home Assistant notifier and check the connection.
+
+    With a state cache (--once runs) that already holds a delivered
+    status, the connection is not checked here; check_connection() is
+    called only once a status actually has to be sent.
+
+    Args:
+        config: Application configuration
+        pool_size: Connection pool size for the notifier
+        state_cache: Locked state cache for --once runs, or None
+
+    Returns:
+        (notifier, last delivered state); the notifier is None if Home
+        Assistant could not be reached
+    """
+    from .notifiers import HomeAssistantNotifier
+
+    notifier = HomeAssistantNotifier(config.ha_url, config.ha_token, pool_size=pool_size)
+    delivered = state_cache.load(notifier.service_url) if state_cache else None
+    if delivered:
+        return notifier, delivered
+
+    # Nothing delivered yet, so the first status will be sent: check now
+    if not check_connection(notifier):
+        return None, None
+    return notifier, None
+
+
+def check_connection(
+    notifier: "HomeAssistantNotifier",
+    state_cache: Optional["StateCache"] = None,
+    delivered: Optional["DeliveredState"] = None,
+) -> bool:
+    """Check that Home Assistant is reachable.
+
+    The check is skipped if the state cache shows a recent successful
+    delivery to the same target.
+
+    Returns:
+        True if Home Assistant is reachable (or was recently)
+    """
+    if delivered and state_cache and state_cache.is_recent(delivered):
+        logger.debug("Status delivered recently, skipping connection check")
+        return True
+    if not notifier.test_connection():
+        logger.error("Failed to connect to Home Assistant")
+        return False
+    logger.info("Connected to Home Assistant")
+    return True
+
+
+def reload_config(
+    config_file: Path,
+    config: Config,
+    detectors: list,
+    notifier: Optional["HomeAssistantNotifier"],
+) -> Optional[tuple[Config, list, Optional["HomeAssistantNotifier"]]]:
+    """Load a changed config file, rebuilding only the parts that changed.
+
+    Args:
+        config_file: Config file to load
+        config: Current configuration
+        detectors: Current detectors (reused where still configured)
+        notifier: Current notifier, or None in dry-run mode
+
+    Returns:
+        New (config, detectors, notifier) to swap in, or None to keep the current ones
+    """
+    try:
+        new_config = Config.load(config_file)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to reload config: {e}")
+        return None
+
+    errors = new_config.validate()
+    if errors and notifier:
+        for error in errors:
+            logger.error(f"Configuration error: {error}")
+        logger.error("Keeping previous configuration")
+        return None
+
+    changed = [f.name for f in fields(Config) if getattr(config, f.name) != getattr(new_config, f.name)]
+    if not changed:
+        return None
+    logger.info(f"Config file changed: {', '.join(changed)}")
+
+    new_detectors = detectors
+    if "detectors" in changed:
+        # Keep already-compiled detectors, only build the new ones
+        existing = {d.name: d for d in detectors}
+        new_detectors = []
+        for name in new_config.detectors:
+            if name.lower() in existing:
+                new_detectors.append(existing[name.lower()])
+            else:
+                new_detectors.extend(get_detectors([name]))
+        if not new_detectors:
+            logger.error("No valid detectors configured, keeping previous configuration")
+            return None
+        logger.info(f"Active detectors: {[d.name for d in new_detectors]}")
+
+    new_notifier = notifier
+    if notifier and ("ha_url" in changed or "ha_token" in changed):
+        from .notifiers import HomeAssistantNotifier
+
+        new_notifier = HomeAssistantNotifier(
+            new_config.ha_url, new_config.ha_token, timeout=notifier.timeout,
+        )
+        if not new_notifier.test_connection():
+            logger.error("Failed to connect to Home Assistant, keeping previous configuration")
+            new_notifier.close()
+            return None
+        logger.info("Connected to Home Assistant")
+        notifier.close()
+
+    return new_config, new_detectors, new_notifier
+
+
+def open_history(history_file: str) -> Optional["HistoryWriter"]:
+    """Open the transition history log, or return None if it is disabled."""
+    if not history_file:
+        return None
+
+    from .history import HistoryWriter
+
+    try:
+        return HistoryWriter(Path(history_file).expanduser())
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to open history file {history_file}: {e}")
+        return None
+
+
+def show_history(path: Path, period: str, days: int) -> None:
+    """Print hours in meetings per day or week for the last N days."""
+    from datetime import date, timedelta
+
+    from .history import HistoryReader
+
+    try:
+        reader = HistoryReader(path)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to read history: {e}")
+        sys.exit(1)
+    try:
+        end = date.today() + timedelta(days=1)
+        start = end - timedelta(days=days)
+        for bucket, hours in reader.rollup(start, end, period):
+            print(f"{bucket.isoformat()}  {hours:6.2f}h")
+    finally:
+        reader.close()
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -73,6 +363,39 @@ def main():
         action="store_true",
         help="Run once and exit (don't poll)",
     )
+    parser.add_argument(
+        "--multi-session",
+        action="store_true",
+        help="Monitor every X session on this host (Linux only)",
+    )
+    parser.add_argument(
+        "--memory-monitor",
+        action="store_true",
+        help="Track memory growth and log the top-growing allocation sites "
+             "(SIGUSR2 dumps a snapshot)",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    history_parser = subparsers.add_parser(
+        "history",
+        help="Show hours in meetings per day or week",
+    )
+    history_parser.add_argument(
+        "--by",
+        choices=["day", "week"],
+        default="day",
+        help="Roll up per day or per week (default: day)",
+    )
+    history_parser.add_argument(
+        "--days",
+        type=int,
+        default=7,
+        help="Number of days to report, ending today (default: 7)",
+    )
+    history_parser.add_argument(
+        "--file",
+        type=Path,
+        help="History file (default: history_file from config)",
+    )
     args = parser.parse_args()
 
     if args.verbose:
@@ -80,7 +403,26 @@ def main():
 
     # Load configuration
     config = Config.load(args.config)
+
+    if args.command == "history":
+        from .history import default_history_path
+
+        path = args.file
+        if path is None:
+            if not config.history_file:
+                # The agent only records history when history_file is set
+                logger.error(
+                    "history_file is not configured, so no history is recorded; set it in "
+                    f"config.json (e.g. \"{default_history_path()}\") or pass --file"
+                )
+                sys.exit(1)
+            path = Path(config.history_file).expanduser()
+        show_history(path, args.by, args.days)
+        return
+
     errors = config.validate()
+    if args.multi_session:
+        errors.extend(config.validate_sessions())
     if errors and not args.dry_run:
         for error in errors:
             logger.error(f"Configuration error: {error}")
@@ -90,69 +432,174 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Initialize platform
-    platform = get_platform()
-    logger.info(f"Using platform: {platform.name}")
-
-    if not platform.is_available():
-        logger.error(f"Platform {platform.name} is not available. Required tools not found.")
+    if args.multi_session and not sys.platform.startswith("linux"):
+        logger.error("--multi-session is only supported on Linux")
         sys.exit(1)
 
-    # Initialize detectors
-    detectors = get_detectors(config.detectors)
+    # Probe the platform, compile detectors and check Home Assistant
+    # concurrently; the first detection doesn't wait for the network.
+    # Each session gets its own platform in multi-session mode.
+    platform_future = None
+    if not args.multi_session:
+        platform_future = run_in_background(init_platform)
+
+    detectors_future = run_in_background(get_detectors, config.detectors)
+
+    notifier_future = None
+    state_cache = None
+    if not args.dry_run:
+        # One-shot runs remember the last delivered state between invocations
+        if args.once and not args.multi_session:
+            from .state import StateCache
+
+            state_cache = StateCache()
+            state_cache.acquire()
+
+        # Sessions share one connection pool, sized for the worker threads
+        pool_size = config.session_workers if args.multi_session else None
+        notifier_future = run_in_background(connect_notifier, config, pool_size, state_cache)
+
+    detectors = detectors_future.result()
     if not detectors:
         logger.error("No valid detectors configured")
         sys.exit(1)
 
     logger.info(f"Active detectors: {[d.name for d in detectors]}")
 
-    # Initialize notifier
-    notifier = None
-    if not args.dry_run:
-        notifier = HomeAssistantNotifier(config.ha_url, config.ha_token)
-        if not notifier.test_connection():
-            logger.error("Failed to connect to Home Assistant")
+    platform = None
+    if platform_future:
+        platform, available = platform_future.result()
+        if not available:
+            logger.error(f"Platform {platform.name} is not available. Required tools not found.")
             sys.exit(1)
-        logger.info("Connected to Home Assistant")
+
+    notifier = None
+    delivered = None
+
+    memory_monitor = None
+    if args.memory_monitor and not args.once:
+        from .memwatch import MemoryMonitor
+
+        memory_monitor = MemoryMonitor()
+
+    if args.multi_session:
+        from .sessions import MultiSessionMonitor
+
+        if notifier_future:
+            notifier, _ = notifier_future.result()
+            if notifier is None:
+                sys.exit(1)
+
+        monitor = MultiSessionMonitor(config, detectors, notifier)
+        logger.info(f"Starting multi-session polling (interval: {config.poll_interval_seconds}s)")
+        monitor.run(
+            lambda: running,
+            once=args.once,
+            on_cycle=memory_monitor.poll if memory_monitor else None,
+        )
+        if memory_monitor:
+            memory_monitor.stop()
+        logger.info(f"Session stats: {monitor.stats()}")
+        logger.info("Shutting down")
+        return
+
+    # Watch meeting app processes so their exit wakes the loop immediately
+    watcher = None
+    if not args.once and ProcessExitWatcher.is_supported():
+        watcher = ProcessExitWatcher()
+        watched_names = {n for d in detectors for n in d.process_names}
+
+    # Reload the config file when it changes
+    config_watcher = None
+    config_path = Config.find_file(args.config)
+    if not args.once and config_path:
+        from .config_watcher import ConfigWatcher
+
+        config_watcher = ConfigWatcher(config_path)
+
+    # Record transitions for later rollups
+    history = None if args.once else open_history(config.history_file)
 
     # State tracking
     previous_in_meeting = None
+    backends_ranked = False
 
     logger.info(f"Starting polling loop (interval: {config.poll_interval_seconds}s)")
 
     while running:
         try:
-            # Get current windows with process info
-            windows = platform.get_windows()
-            logger.debug(f"Found {len(windows)} windows")
+            if config_watcher and config_watcher.changed():
+                reloaded = reload_config(config_watcher.path, config, detectors, notifier)
+                if reloaded:
+                    if reloaded[2] is not notifier:
+                        # The new target hasn't been sent the current status
+                        previous_in_meeting = None
+                    if reloaded[0].history_file != config.history_file:
+                        # Open the new log first so a bad path keeps the old one
+                        new_history = open_history(reloaded[0].history_file)
+                        if new_history or not reloaded[0].history_file:
+                            if history:
+                                history.close()
+                            history = new_history
+                        else:
+                            logger.error("Keeping the previous history file")
+                    config, detectors, notifier = reloaded
+                    if watcher:
+                        watched_names = {n for d in detectors for n in d.process_names}
 
-            # Check each detector
-            in_meeting = False
-            for detector in detectors:
-                if detector.is_in_meeting(windows):
-                    in_meeting = True
-                    logger.debug(f"Meeting detected by {detector.name}")
-                    break
+            # Get current windows with process info
+            windows, in_meeting = detect_status(platform, detectors)
+
+            if notifier_future:
+                # First detection is done; now wait for Home Assistant
+                if in_meeting is not None:
+                    logger.info(f"Initial status: {'IN MEETING' if in_meeting else 'NOT IN MEETING'}")
+                notifier, delivered = notifier_future.result()
+                notifier_future = None
+                if notifier is None:
+                    sys.exit(1)
+                if delivered:
+                    previous_in_meeting = delivered.in_meeting
+
+            if in_meeting is None and args.once:
+                sys.exit(1)
 
             # Only send notification on state change
-            if in_meeting != previous_in_meeting:
-                status = "IN MEETING" if in_meeting else "NOT IN MEETING"
-                logger.info(f"Status changed: {status}")
-
-                if notifier:
-                    if notifier.notify(in_meeting):
-                        previous_in_meeting = in_meeting
-                    else:
-                        logger.warning("Failed to send notification, will retry")
-                else:
-                    # Dry run mode
-                    print(f"[DRY RUN] Would send: {status}")
-                    previous_in_meeting = in_meeting
+            previous_in_meeting = update_status(
+                notifier, in_meeting, previous_in_meeting, state_cache, delivered,
+            )
+
+            if history:
+                try:
+                    if in_meeting is not None:
+                        history.record(in_meeting)
+                    # Fsync a transition recorded during a quiet stretch
+                    history.sync_if_due()
+                except OSError as e:
+                    logger.warning(f"Failed to record history: {e}")
 
             if args.once:
                 break
 
-            time.sleep(config.poll_interval_seconds)
+            if not backends_ranked:
+                # The first status used preference order; now time every
+                # backend and rank them by latency
+                platform.backend_manager.probe(measure=True)
+                backends_ranked = True
+
+            if memory_monitor:
+                memory_monitor.poll()
+
+            if watcher:
+                if in_meeting is not None:
+                    watcher.watch({
+                        w.pid for w in windows
+                        if w.pid and w.process_name in watched_names
+                    })
+                if watcher.wait(config.poll_interval_seconds):
+                    logger.debug("Meeting app exited, re-evaluating now")
+            else:
+                time.sleep(config.poll_interval_seconds)
 
         except Exception as e:
             logger.error(f"Error in main loop: {e}")
@@ -160,6 +607,17 @@ def main():
                 sys.exit(1)
             time.sleep(config.poll_interval_seconds)
 
+    if watcher:
+        watcher.close()
+    if config_watcher:
+        config_watcher.close()
+    if history:
+        history.close()
+    if memory_monitor:
+        memory_monitor.stop()
+    if state_cache:
+        state_cache.release()
+    logger.info(f"Window backend stats: {platform.stats()}")
     logger.info("Shutting down")
 
 
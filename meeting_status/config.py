@@ -15,6 +15,28 @@ class Config:
     ha_token: str
     poll_interval_seconds: int = 2
     detectors: list[str] = field(default_factory=lambda: ["teams", "zoom"])
+    # Multi-session mode: user name -> HA script; "*" matches any user and
+    # may contain a "{user}" placeholder
+    session_scripts: dict[str, str] = field(default_factory=dict)
+    session_workers: int = 16
+    # Transition history log; empty disables it
+    history_file: str = ""
+
+    @staticmethod
+    def find_file(config_file: Optional[Path] = None) -> Optional[Path]:
+        """Return the config file that load() would read, if any."""
+        if config_file and config_file.exists():
+            return config_file
+
+        # Check default locations
+        default_paths = [
+            Path.cwd() / "config.json",
+            Path.home() / ".config" / "meeting_status" / "config.json",
+        ]
+        for path in default_paths:
+            if path.exists():
+                return path
+        return None
 
     @classmethod
     def load(cls, config_file: Optional[Path] = None) -> "Config":
@@ -25,20 +47,10 @@ class Config:
         config_data = {}
 
         # Try to load from config file
-        if config_file and config_file.exists():
-            with open(config_file) as f:
+        path = cls.find_file(config_file)
+        if path:
+            with open(path) as f:
                 config_data = json.load(f)
-        else:
-            # Check default locations
-            default_paths = [
-                Path.cwd() / "config.json",
-                Path.home() / ".config" / "meeting_status" / "config.json",
-            ]
-            for path in default_paths:
-                if path.exists():
-                    with open(path) as f:
-                        config_data = json.load(f)
-                    break
 
         # Environment variables override config file
         ha_url = os.environ.get("HA_URL", config_data.get("ha_url", ""))
@@ -61,6 +73,9 @@ class Config:
             ha_token=ha_token,
             poll_interval_seconds=poll_interval_seconds,
             detectors=detectors,
+            session_scripts=config_data.get("session_scripts", {}),
+            session_workers=config_data.get("session_workers", 16),
+            history_file=config_data.get("history_file", ""),
         )
 
     def validate(self) -> list[str]:
@@ -72,4 +87,38 @@ class Config:
             errors.append("HA_TOKEN or ha_token is required")
         if self.poll_interval_seconds < 1:
             errors.append("Poll interval must be at least 1 second")
+        if self.session_workers < 1:
+            errors.append("session_workers must be at least 1")
         return errors
+
+    def validate_sessions(self) -> list[str]:
+        """Validate the multi-session settings and return list of errors."""
+        if not self.session_scripts:
+            return ["session_scripts is required for --multi-session"]
+        if not isinstance(self.session_scripts, dict):
+            return ["session_scripts must map user names to script names"]
+
+        errors = []
+        for user, script in self.session_scripts.items():
+            try:
+                script.format(user="x")
+            except (AttributeError, IndexError, KeyError, ValueError):
+                errors.append(
+                    f"Invalid session script for {user!r}: {script!r} "
+                    f"(only {{user}} may be used as a placeholder)"
+                )
+        return errors
+
+    def session_script(self, user: str) -> Optional[str]:
+        """Return the HA script for a user's session in multi-session mode.
+
+        Args:
+            user: Login name of the session owner
+
+        Returns:
+            Script name, or None if the user has no notification target
+        """
+        script = self.session_scripts.get(user, self.session_scripts.get("*"))
+        if script is None:
+            return None
+        return script.format(user=user)
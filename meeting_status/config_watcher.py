@@ -0,0 +1,159 @@
+"""Detect changes to the config file, via inotify where available."""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# From <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class ConfigWatcher:
+    """Report whether the config file changed since the last check.
+
+    On Linux the file's directory is watched with inotify (editors and
+    config management usually replace files rather than rewrite them);
+    elsewhere, or if inotify is unavailable, the file's stat signature is
+    compared on each check. If the config is a symlink (stow,
+    home-manager, Kubernetes ConfigMaps), the target's directory is
+    watched too and any event in the link's directory re-resolves the
+    link, so both edits to the target and re-pointed links are seen.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the watcher.
+
+        Args:
+            path: Config file to watch
+        """
+        self.path = path
+        self._fd: Optional[int] = None
+        self._libc = None
+        # Watch descriptor -> file name of interest, or None for any event
+        self._watches: dict[int, Optional[bytes]] = {}
+        self._target_wd: Optional[int] = None
+        self._target: Optional[Path] = None
+        self._signature = self._stat_signature()
+
+        if sys.platform.startswith("linux"):
+            self._fd = self._init_inotify()
+        logger.debug(
+            f"Watching {path} for changes "
+            f"({'inotify' if self._fd is not None else 'stat polling'})"
+        )
+
+    def _init_inotify(self) -> Optional[int]:
+        """Set up non-blocking inotify watches on the config (and link target) directory."""
+        fd = None
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            self._fd = fd
+            target = self.path.resolve()
+            symlinked = target != self.path.absolute()
+            # Any change next to a symlinked config may re-point it
+            self._add_watch(self.path.parent, None if symlinked else self.path.name)
+            if symlinked:
+                self._watch_target(target)
+            return fd
+        except (OSError, AttributeError) as e:
+            if fd is not None and fd >= 0:
+                os.close(fd)
+            self._fd = None
+            self._watches.clear()
+            logger.debug(f"inotify unavailable, falling back to stat polling: {e}")
+            return None
+
+    def _add_watch(self, directory: Path, name: Optional[str]) -> int:
+        """Watch a directory for events on one file name (or any, if None)."""
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        if self._watches.get(wd, b"") is not None:
+            # The same directory may be watched for the link and its target
+            self._watches[wd] = os.fsencode(name) if name is not None else None
+        return wd
+
+    def _watch_target(self, target: Path) -> None:
+        """Watch the directory holding a symlinked config's current target."""
+        if self._target_wd is not None and self._watches.get(self._target_wd) is not None:
+            self._libc.inotify_rm_watch(self._fd, self._target_wd)
+            del self._watches[self._target_wd]
+        self._target = target
+        try:
+            self._target_wd = self._add_watch(target.parent, target.name)
+        except OSError as e:
+            # The target may be mid-swap; the next event re-resolves it
+            self._target_wd = None
+            logger.debug(f"Cannot watch config target {target}: {e}")
+
+    def _stat_signature(self) -> Optional[tuple[int, int, int]]:
+        """Return (mtime_ns, size, inode) of the config file, or None if missing."""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _drain_inotify(self) -> bool:
+        """Read pending inotify events; return True if any may concern the config file."""
+        touched = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                event_name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if wd in self._watches and self._watches[wd] in (None, event_name):
+                    touched = True
+
+        if touched and self._target is not None:
+            target = self.path.resolve()
+            if target != self._target or self._target_wd is None:
+                self._watch_target(target)
+        return touched
+
+    def changed(self) -> bool:
+        """Check if the config file changed since the previous call.
+
+        Returns:
+            True if the file's contents may have changed
+        """
+        if self._fd is not None and not self._drain_inotify():
+            return False
+
+        # Confirm with stat; a deleted file keeps the current config
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        return signature is not None
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -1,7 +1,8 @@
 """Meeting detectors for various conferencing applications."""
 
 from .base import MeetingDetector
+from .browser import BrowserDetector
 from .teams import TeamsDetector
 from .zoom import ZoomDetector
 
-__all__ = ["MeetingDetector", "TeamsDetector", "ZoomDetector"]
+__all__ = ["BrowserDetector", "MeetingDetector", "TeamsDetector", "ZoomDetector"]
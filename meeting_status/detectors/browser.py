@@ -0,0 +1,79 @@
+"""Browser-hosted meeting detector (Google Meet, Teams web, Zoom web client)."""
+
+import re
+from .base import MeetingDetector
+
+
+class BrowserDetector(MeetingDetector):
+    """Detect meetings held in a web browser from tab/window titles.
+
+    Browsers own the most windows and the longest titles, so titles are
+    first checked for a few cheap literals and only survivors are run
+    through the regexes. Regex verdicts are cached per title.
+    """
+
+    # Valid process names for common browsers
+    PROCESS_NAMES = [
+        "chrome",          # Google Chrome (Linux comm, Windows)
+        "google-chrome",
+        "google chrome",   # macOS process name
+        "chromium",
+        "chromium-browser",
+        "firefox",
+        "firefox-esr",
+        "firefox-bin",
+        "msedge",          # Microsoft Edge (Windows)
+        "microsoft-edge",
+        "microsoft edge",  # macOS process name
+        "brave",
+        "brave-browser",
+        "brave browser",   # macOS process name
+        "vivaldi",
+        "vivaldi-bin",
+        "opera",
+        "safari",
+    ]
+
+    # Every meeting pattern contains one of these (lowercase) literals;
+    # titles without any of them cannot match and skip the regexes
+    PREFILTER_LITERALS = ("meet", "teams", "zoom")
+
+    # Patterns that indicate an active meeting
+    MEETING_PATTERNS = [
+        # Google Meet: "Meet - abc-defg-hij - Google Chrome" or "Meet – Weekly sync"
+        r"^(\(\d+\)\s+)?Meet\s+[-–—]\s+\S",
+        # Teams web: "Meeting with Alice | Microsoft Teams", "Call with Bob | Microsoft Teams"
+        r"\b(Meeting|Call) (with|in) .*Microsoft Teams",
+        r"\bMeeting now\b.*Microsoft Teams",
+        # Zoom web client: "Zoom Meeting - Google Chrome"
+        r"^Zoom (Meeting|Webinar)\b",
+    ]
+
+    # Bound the verdict cache; browsers churn through many tab titles
+    MAX_CACHED_TITLES = 1024
+
+    def __init__(self):
+        self._meeting_regexes = [re.compile(p, re.IGNORECASE) for p in self.MEETING_PATTERNS]
+        self._verdicts: dict[str, bool] = {}
+
+    @property
+    def name(self) -> str:
+        return "browser"
+
+    @property
+    def process_names(self) -> list[str]:
+        return self.PROCESS_NAMES
+
+    def is_meeting_title(self, title: str) -> bool:
+        """Check if a browser window title indicates an active meeting."""
+        lowered = title.lower()
+        if not any(literal in lowered for literal in self.PREFILTER_LITERALS):
+            return False
+
+        verdict = self._verdicts.get(title)
+        if verdict is None:
+            verdict = any(regex.search(title) for regex in self._meeting_regexes)
+            if len(self._verdicts) >= self.MAX_CACHED_TITLES:
+                self._verdicts.clear()
+            self._verdicts[title] = verdict
+        return verdict
@@ -0,0 +1,258 @@
+"""Append-only binary log of meeting status transitions with rollup queries."""
+
+import bisect
+import logging
+import mmap
+import os
+import struct
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MSHIST1\n"
+
+# Record: unix time in milliseconds, state
+RECORD = struct.Struct("<qB")
+
+STATE_FREE = 0
+STATE_MEETING = 1
+STATE_STOPPED = 2  # Agent shut down; time until the next record is unknown
+
+
+def default_history_path() -> Path:
+    """Return $XDG_DATA_HOME/meeting_status/history.bin."""
+    data_home = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(data_home) / "meeting_status" / "history.bin"
+
+
+class HistoryWriter:
+    """Append transitions to the history log.
+
+    Records are written and flushed immediately. They are fsynced by
+    sync_if_due(), which the polling loop calls every poll, once
+    FSYNC_INTERVAL_SECONDS have passed since the last fsync (and on
+    close); losing up to a minute of history in a crash is acceptable.
+
+    Timestamps never go backwards: if the wall clock steps back (NTP,
+    suspend/resume), a record gets the previous record's timestamp so the
+    log stays sorted for HistoryReader's binary search.
+    """
+
+    FSYNC_INTERVAL_SECONDS = 60.0
+
+    def __init__(self, path: Path):
+        """Open (or create) the log for appending.
+
+        Args:
+            path: History file
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "ab")
+        size = self._file.tell()
+        try:
+            if size == 0:
+                self._file.write(MAGIC)
+                self._file.flush()
+            else:
+                # Check before truncating anything: it may be some other file
+                with open(path, "rb") as f:
+                    if f.read(len(MAGIC)) != MAGIC:
+                        raise ValueError(f"{path} is not a meeting status history file")
+                # Drop a record cut short by a crash so later records stay aligned
+                partial = (size - len(MAGIC)) % RECORD.size
+                if partial:
+                    self._file.truncate(size - partial)
+        except BaseException:
+            self._file.close()
+            raise
+        self._last_fsync = time.monotonic()
+        self._dirty = False
+
+        reader = HistoryReader(path)
+        try:
+            last = reader.last()
+        finally:
+            reader.close()
+        self._last_ms = last[0] if last else 0
+        self._last_state = last[1] if last else None
+
+    def record(self, in_meeting: bool, timestamp: Optional[float] = None) -> None:
+        """Append a transition if the state differs from the last record.
+
+        Args:
+            in_meeting: New meeting status
+            timestamp: time.time() of the transition (default: now)
+        """
+        self._append(STATE_MEETING if in_meeting else STATE_FREE, timestamp)
+
+    def _append(self, state: int, timestamp: Optional[float] = None) -> None:
+        if state == self._last_state:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+
+        timestamp_ms = max(int(timestamp * 1000), self._last_ms)
+        self._file.write(RECORD.pack(timestamp_ms, state))
+        self._file.flush()
+        self._last_ms = timestamp_ms
+        self._last_state = state
+        self._dirty = True
+        self.sync_if_due()
+
+    def sync_if_due(self) -> None:
+        """Fsync unsynced records if FSYNC_INTERVAL_SECONDS have passed."""
+        if self._dirty and time.monotonic() - self._last_fsync >= self.FSYNC_INTERVAL_SECONDS:
+            self._fsync()
+
+    def _fsync(self) -> None:
+        os.fsync(self._file.fileno())
+        self._last_fsync = time.monotonic()
+        self._dirty = False
+
+    def close(self) -> None:
+        """Mark the agent as stopped and sync the log."""
+        self._append(STATE_STOPPED)
+        if self._dirty:
+            self._fsync()
+        self._file.close()
+
+
+class _Timestamps:
+    """Sequence view of record timestamps for bisect."""
+
+    def __init__(self, reader: "HistoryReader"):
+        self._reader = reader
+
+    def __len__(self) -> int:
+        return len(self._reader)
+
+    def __getitem__(self, index: int) -> int:
+        return self._reader.record(index)[0]
+
+
+class HistoryReader:
+    """Memory-mapped, read-only view of the history log."""
+
+    def __init__(self, path: Path):
+        """Map the log.
+
+        Args:
+            path: History file
+        """
+        self.path = path
+        self._mmap: Optional[mmap.mmap] = None
+        self._count = 0
+
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > len(MAGIC):
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return
+
+        if self._mmap is not None:
+            if self._mmap[:len(MAGIC)] != MAGIC:
+                self._mmap.close()
+                raise ValueError(f"{path} is not a meeting status history file")
+            # Ignore a partially written trailing record
+            self._count = (len(self._mmap) - len(MAGIC)) // RECORD.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, index: int) -> tuple[int, int]:
+        """Return (timestamp_ms, state) of a record."""
+        return RECORD.unpack_from(self._mmap, len(MAGIC) + index * RECORD.size)
+
+    def last(self) -> Optional[tuple[int, int]]:
+        """Return the most recent record, if any."""
+        return self.record(self._count - 1) if self._count else None
+
+    def records_between(self, start_ms: int, end_ms: int) -> Iterator[tuple[int, int]]:
+        """Yield the record in effect at start_ms and all records before end_ms.
+
+        Uses binary search on timestamps, so the cost depends on the size
+        of the range, not of the whole log.
+        """
+        first = bisect.bisect_right(_Timestamps(self), start_ms)
+        # Include the record in effect at start_ms
+        index = max(first - 1, 0)
+        while index < self._count:
+            record = self.record(index)
+            if record[0] >= end_ms:
+                break
+            yield record
+            index += 1
+
+    def rollup(self, start: date, end: date, period: str = "day") -> list[tuple[date, float]]:
+        """Compute hours in meetings per day or week.
+
+        Args:
+            start: First day (inclusive)
+            end: Last day (exclusive)
+            period: "day" or "week" (weeks start on Monday)
+
+        Returns:
+            List of (bucket start date, hours in meetings)
+        """
+        if period == "week":
+            start -= timedelta(days=start.weekday())
+            step = timedelta(weeks=1)
+        else:
+            step = timedelta(days=1)
+
+        buckets = []
+        day = start
+        while day < end:
+            buckets.append(day)
+            day += step
+        if not buckets:
+            return []
+
+        # Local-time bucket boundaries in milliseconds
+        bounds = [_to_ms(d) for d in buckets] + [_to_ms(buckets[-1] + step)]
+        totals = [0.0] * len(buckets)
+
+        now_ms = int(time.time() * 1000)
+        range_start, range_end = bounds[0], min(bounds[-1], now_ms)
+
+        previous: Optional[tuple[int, int]] = None
+        for record in self.records_between(range_start, range_end):
+            if previous is not None and previous[1] == STATE_MEETING:
+                _add_interval(totals, bounds, previous[0], record[0])
+            previous = record
+        if previous is not None and previous[1] == STATE_MEETING:
+            # Still in the meeting (or the agent died without a stop record)
+            _add_interval(totals, bounds, previous[0], range_end)
+
+        return [(b, ms / 3_600_000) for b, ms in zip(buckets, totals)]
+
+    def close(self) -> None:
+        """Unmap the log."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def _to_ms(day: date) -> int:
+    """Return local midnight of a day as unix milliseconds."""
+    return int(datetime(day.year, day.month, day.day).timestamp() * 1000)
+
+
+def _add_interval(totals: list[float], bounds: list[int], start_ms: int, end_ms: int) -> None:
+    """Add the part of [start_ms, end_ms) inside each bucket to its total."""
+    start_ms = max(start_ms, bounds[0])
+    end_ms = min(end_ms, bounds[-1])
+    if start_ms >= end_ms:
+        return
+    index = bisect.bisect_right(bounds, start_ms) - 1
+    while start_ms < end_ms:
+        bucket_end = min(bounds[index + 1], end_ms)
+        totals[index] += bucket_end - start_ms
+        start_ms = bucket_end
+        index += 1
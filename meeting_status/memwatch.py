@@ -0,0 +1,179 @@
+"""Opt-in memory watchdog for long-running agents."""
+
+import logging
+import os
+import signal
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def current_rss() -> Optional[int]:
+    """Return the resident set size of this process in bytes, if known.
+
+    Without /proc or psutil (e.g. macOS) this is the peak RSS reported by
+    getrusage(), which still rises steadily when memory leaks.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    try:
+        import resource
+    except ImportError:  # Windows without psutil
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux and the BSDs KiB
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class MemoryMonitor:
+    """Sample RSS and tracemalloc snapshots, and report what grew.
+
+    tracemalloc records a single frame per allocation to keep the overhead
+    low. Every SAMPLE_INTERVAL_SECONDS the RSS is sampled and a snapshot is
+    taken; if RSS has grown by more than GROWTH_THRESHOLD_BYTES since the
+    baseline, the top-growing allocation sites since the baseline snapshot
+    are logged and the baseline moves forward. Where RSS cannot be measured
+    the memory traced by tracemalloc is used instead. Only the baseline
+    snapshot is kept between samples. SIGUSR2 dumps a snapshot to DUMP_DIR.
+    """
+
+    SAMPLE_INTERVAL_SECONDS = 300.0
+    GROWTH_THRESHOLD_BYTES = 4 * 1024 * 1024
+    TOP_SITES = 10
+    TRACEBACK_FRAMES = 1
+
+    def __init__(
+        self,
+        sample_interval: float = SAMPLE_INTERVAL_SECONDS,
+        growth_threshold: int = GROWTH_THRESHOLD_BYTES,
+        dump_dir: Optional[Path] = None,
+    ):
+        """Start tracing allocations.
+
+        Args:
+            sample_interval: Seconds between samples
+            growth_threshold: RSS growth in bytes that triggers a report
+            dump_dir: Where signal-triggered snapshots go (default: ~/.cache/meeting_status)
+        """
+        self.sample_interval = sample_interval
+        self.growth_threshold = growth_threshold
+        if dump_dir is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            dump_dir = Path(cache_home) / "meeting_status"
+        self.dump_dir = dump_dir
+        self._dump_requested = False
+
+        tracemalloc.start(self.TRACEBACK_FRAMES)
+        self._baseline_rss = current_rss()
+        self._baseline_traced = tracemalloc.get_traced_memory()[0]
+        self._baseline = self._snapshot()
+        self._last_sample = time.monotonic()
+
+        if hasattr(signal, "SIGUSR2"):
+            signal.signal(signal.SIGUSR2, self._request_dump)
+
+        logger.info(
+            f"Memory monitor started (RSS {self._format(self._baseline_rss)}, "
+            f"sampling every {self.sample_interval:.0f}s)"
+        )
+        if self._baseline_rss is None:
+            logger.warning(
+                "Cannot measure RSS on this platform (install psutil); "
+                "watching growth of traced Python allocations instead"
+            )
+
+    @staticmethod
+    def _format(size: Optional[int]) -> str:
+        return f"{size / 1024 / 1024:.1f} MiB" if size is not None else "unknown"
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        """Take a snapshot without tracemalloc's and the import system's own allocations."""
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ])
+
+    def _request_dump(self, signum, frame) -> None:
+        """Signal handler: dump a snapshot at the next poll."""
+        self._dump_requested = True
+
+    def poll(self) -> None:
+        """Sample if due and handle pending dump requests. Call once per cycle."""
+        if self._dump_requested:
+            self._dump_requested = False
+            self.dump()
+
+        if time.monotonic() - self._last_sample >= self.sample_interval:
+            self.sample()
+
+    def sample(self) -> None:
+        """Sample RSS and report allocation growth if it passed the threshold."""
+        self._last_sample = time.monotonic()
+        rss = current_rss()
+        traced, peak = tracemalloc.get_traced_memory()
+        logger.debug(
+            f"Memory: RSS {self._format(rss)}, traced {self._format(traced)} "
+            f"(peak {self._format(peak)})"
+        )
+
+        if rss is not None and self._baseline_rss is not None:
+            label, size, growth = "RSS", rss, rss - self._baseline_rss
+        else:
+            label, size, growth = "Traced memory", traced, traced - self._baseline_traced
+        if growth < self.growth_threshold:
+            return
+
+        snapshot = self._snapshot()
+        stats = snapshot.compare_to(self._baseline, "lineno")
+        logger.warning(
+            f"{label} grew by {self._format(growth)} to {self._format(size)}; "
+            f"top growing allocation sites:"
+        )
+        for stat in stats[:self.TOP_SITES]:
+            if stat.size_diff <= 0:
+                break
+            logger.warning(f"  {stat}")
+
+        self._baseline_rss = rss
+        self._baseline_traced = traced
+        self._baseline = snapshot
+
+    def dump(self) -> Optional[Path]:
+        """Write a snapshot to disk and log the largest allocation sites.
+
+        Returns:
+            Path of the dump file, or None if it could not be written
+        """
+        snapshot = self._snapshot()
+        path = self.dump_dir / f"memory-{os.getpid()}-{int(time.time())}.snapshot"
+        try:
+            self.dump_dir.mkdir(parents=True, exist_ok=True)
+            snapshot.dump(str(path))
+        except OSError as e:
+            logger.error(f"Failed to dump memory snapshot: {e}")
+            return None
+
+        logger.info(f"Memory snapshot written to {path} (RSS {self._format(current_rss())})")
+        for stat in snapshot.statistics("lineno")[:self.TOP_SITES]:
+            logger.info(f"  {stat}")
+        return path
+
+    def stop(self) -> None:
+        """Stop tracing allocations."""
+        tracemalloc.stop()
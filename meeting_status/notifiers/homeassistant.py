@@ -1,8 +1,12 @@
 """Home Assistant webhook notifier."""
 
+import copy
 import json
 import logging
+from typing import Optional
+
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -10,20 +14,56 @@ logger = logging.getLogger(__name__)
 class HomeAssistantNotifier:
     """Send meeting status updates to Home Assistant."""
 
-    def __init__(self, ha_url: str, ha_token: str):
+    DEFAULT_SCRIPT = "send_to_led_sign"
+
+    def __init__(
+        self,
+        ha_url: str,
+        ha_token: str,
+        script: str = DEFAULT_SCRIPT,
+        pool_size: Optional[int] = None,
+        timeout: float = 10,
+    ):
         """Initialize the notifier.
 
         Args:
             ha_url: Home Assistant base URL (e.g., http://homeassistant.local:8123)
             ha_token: Long-lived access token
+            script: Home Assistant script that drives the LED sign
+            pool_size: Connections to keep per host (default: requests' default)
+            timeout: Seconds to wait for Home Assistant per request
         """
         self.ha_url = ha_url.rstrip("/")
         self.ha_token = ha_token
+        self.script = script
+        self.timeout = timeout
         self._session = requests.Session()
         self._session.headers.update({
             "Authorization": f"Bearer {ha_token}",
             "Content-Type": "application/json",
         })
+        if pool_size:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+    def for_script(self, script: str) -> "HomeAssistantNotifier":
+        """Return a notifier for another script that shares this connection pool.
+
+        Args:
+            script: Home Assistant script name
+
+        Returns:
+            New HomeAssistantNotifier using the same HTTP session
+        """
+        notifier = copy.copy(self)
+        notifier.script = script
+        return notifier
+
+    @property
+    def service_url(self) -> str:
+        """Return the URL of the Home Assistant script service."""
+        return f"{self.ha_url}/api/services/script/{self.script}"
 
     def notify(self, in_meeting: bool) -> bool:
         """Send meeting status to Home Assistant LED sign script.
@@ -43,10 +83,8 @@ class HomeAssistantNotifier:
         # The service expects payload as an escaped JSON string
         service_data = {"payload": json.dumps(led_payload)}
 
-        url = f"{self.ha_url}/api/services/script/send_to_led_sign"
-
         try:
-            response = self._session.post(url, json=service_data, timeout=10)
+            response = self._session.post(self.service_url, json=service_data, timeout=self.timeout)
             response.raise_for_status()
             logger.debug(f"Successfully sent status to Home Assistant: {led_payload}")
             return True
@@ -61,9 +99,13 @@ class HomeAssistantNotifier:
             True if connection is successful
         """
         try:
-            response = self._session.get(f"{self.ha_url}/api/", timeout=10)
+            response = self._session.get(f"{self.ha_url}/api/", timeout=self.timeout)
             response.raise_for_status()
             return True
         except requests.RequestException as e:
             logger.error(f"Failed to connect to Home Assistant: {e}")
             return False
+
+    def close(self) -> None:
+        """Close the HTTP connection pool (shared with for_script() copies)."""
+        self._session.close()
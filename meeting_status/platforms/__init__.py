@@ -1,7 +1,8 @@
 """Platform-specific window title detection."""
 
 import sys
-from .base import Platform, WindowInfo
+from .base import Backend, Platform, WindowInfo
+from .pidwatch import ProcessExitWatcher
 
 def get_platform() -> Platform:
     """Get the appropriate platform implementation for the current OS."""
@@ -15,4 +16,4 @@ def get_platform() -> Platform:
         from .linux import LinuxPlatform
         return LinuxPlatform()
 
-__all__ = ["Platform", "WindowInfo", "get_platform"]
+__all__ = ["Backend", "Platform", "ProcessExitWatcher", "WindowInfo", "get_platform"]
@@ -0,0 +1,277 @@
+"""Latency-ranked window enumeration backend selection with automatic fallback."""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from .base import Backend, WindowInfo
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackendState:
+    """Probe results and runtime counters for a single backend."""
+
+    backend: Backend
+    available: bool = False
+    working: bool = False
+    probe_latency: Optional[float] = None  # Seconds taken by the last probe
+    probe_window_count: int = 0
+    calls: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    total_latency: float = 0.0
+    demoted: bool = False
+
+    @property
+    def name(self) -> str:
+        return self.backend.name
+
+
+class BackendManager:
+    """Choose the fastest working backend and fall back when it misbehaves.
+
+    Every available backend is probed once (one timed enumeration) and
+    ranked by latency; backends whose trial fails stay in the ranking as
+    demoted, behind the working ones. Polls use the top-ranked backend;
+    after FAILURE_THRESHOLD consecutive failures or slow calls it is
+    demoted to the end of the ranking. Every REPROBE_INTERVAL_SECONDS the
+    demoted and unavailable backends are probed again so a recovered
+    backend can win back its place; healthy backends are not re-probed.
+    """
+
+    FAILURE_THRESHOLD = 3
+    REPROBE_INTERVAL_SECONDS = 600.0
+    SLOW_CALL_SECONDS = 5.0
+
+    def __init__(
+        self,
+        backends: list[Backend],
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reprobe_interval: float = REPROBE_INTERVAL_SECONDS,
+        slow_call_seconds: float = SLOW_CALL_SECONDS,
+    ):
+        """Initialize the manager.
+
+        Args:
+            backends: Backends in order of preference
+            failure_threshold: Consecutive failures before a backend is demoted
+            reprobe_interval: Seconds between re-probes of demoted/unavailable backends
+            slow_call_seconds: Calls slower than this count as failures
+        """
+        self._states = [BackendState(backend=b) for b in backends]
+        self._ranked: list[BackendState] = []
+        self.failure_threshold = failure_threshold
+        self.reprobe_interval = reprobe_interval
+        self.slow_call_seconds = slow_call_seconds
+        self._measured = False
+        self._last_probe: Optional[float] = None
+
+    @property
+    def active(self) -> Optional[str]:
+        """Return the name of the backend currently used for polling."""
+        for state in self._ranked:
+            if not state.demoted:
+                return state.name
+        return self._ranked[0].name if self._ranked else None
+
+    def probe(self, measure: bool = True) -> bool:
+        """Probe all backends and rank the available ones.
+
+        Args:
+            measure: If False, only check availability and rank available
+                backends in preference order (used by one-shot runs and
+                per-session platforms, which would otherwise enumerate
+                windows once per backend)
+
+        Returns:
+            True if at least one backend is available. A backend whose
+            trial enumeration fails (e.g. the X server is not up yet)
+            still counts; it is ranked last and retried on every poll.
+        """
+        for state in self._states:
+            state.available = False
+            state.working = False
+            state.probe_latency = None
+            state.probe_window_count = 0
+            state.consecutive_failures = 0
+            state.demoted = False
+
+            if not self._check_available(state):
+                continue
+            if measure:
+                state.demoted = not self._trial(state)
+            else:
+                state.working = True
+
+        self._measured = measure
+        self._rank()
+
+        timings = ", ".join(self._describe(s) for s in self._states)
+        if not self._ranked:
+            logger.warning(f"No window backend available ({timings})")
+        elif all(s.demoted for s in self._ranked):
+            logger.warning(f"No window backend works yet, will keep trying ({timings})")
+        else:
+            logger.info(f"Window backend: {self.active} ({timings})")
+
+        return bool(self._ranked)
+
+    def reprobe(self) -> None:
+        """Probe demoted and unavailable backends again.
+
+        Backends that are in use and healthy keep their rank and are not
+        enumerated; the others get a fresh availability check and, if
+        present, one timed enumeration. Those that succeed are reinstated.
+        """
+        for state in self._states:
+            if state.available and not state.demoted:
+                continue
+            if not self._check_available(state):
+                state.demoted = False
+                continue
+            if self._trial(state):
+                if state.demoted:
+                    logger.info(f"Window backend {state.name} recovered")
+                state.demoted = False
+                state.consecutive_failures = 0
+            else:
+                state.demoted = True
+
+        previous = self.active
+        self._rank()
+        if self.active != previous:
+            logger.info(f"Window backend: {self.active} (was {previous})")
+
+    def _check_available(self, state: BackendState) -> bool:
+        """Run a backend's cheap availability check."""
+        try:
+            state.available = bool(state.backend.is_available())
+        except Exception as e:
+            logger.debug(f"Backend {state.name} availability check failed: {e}")
+            state.available = False
+        return state.available
+
+    def _trial(self, state: BackendState) -> bool:
+        """Time one enumeration with a backend.
+
+        Returns:
+            True if the enumeration succeeded
+        """
+        start = time.perf_counter()
+        try:
+            windows = state.backend.get_windows()
+        except Exception as e:
+            logger.debug(f"Backend {state.name} probe failed: {e}")
+            windows = None
+        state.probe_latency = time.perf_counter() - start
+
+        state.working = windows is not None
+        state.probe_window_count = len(windows) if windows is not None else 0
+        return state.working
+
+    def _rank(self) -> None:
+        """Order available backends: healthy first, then demoted."""
+        def key(state: BackendState) -> tuple:
+            if not self._measured or state.probe_latency is None:
+                return (state.demoted,)
+            # Prefer backends that actually saw windows, then the fastest one
+            return (state.demoted, state.probe_window_count == 0, state.probe_latency)
+
+        # list.sort() is stable, so preference order breaks remaining ties
+        self._ranked = sorted((s for s in self._states if s.available), key=key)
+        self._last_probe = time.monotonic()
+
+    def get_windows(self) -> Optional[list[WindowInfo]]:
+        """Get windows from the best backend, falling back on failure.
+
+        Returns:
+            List of WindowInfo objects, or None if every backend failed
+            (callers should keep their previous state rather than treat
+            it as "no windows")
+        """
+        if self._last_probe is None:
+            self.probe()
+        elif time.monotonic() - self._last_probe >= self.reprobe_interval:
+            self.reprobe()
+
+        # Demoted backends sit at the end and are only tried as a last resort
+        for state in list(self._ranked):
+            start = time.perf_counter()
+            try:
+                windows = state.backend.get_windows()
+            except Exception as e:
+                logger.debug(f"Backend {state.name} failed: {e}")
+                windows = None
+            elapsed = time.perf_counter() - start
+
+            state.calls += 1
+            state.total_latency += elapsed
+
+            if windows is not None and elapsed < self.slow_call_seconds:
+                state.consecutive_failures = 0
+                return windows
+
+            state.failures += 1
+            state.consecutive_failures += 1
+            if windows is None:
+                logger.debug(f"Backend {state.name} returned no result")
+            else:
+                logger.debug(f"Backend {state.name} slow call ({elapsed:.2f}s)")
+
+            if state.consecutive_failures >= self.failure_threshold and not state.demoted:
+                self._demote(state)
+
+            if windows is not None:
+                # Slow but usable - still better than nothing this cycle
+                return windows
+
+        return None
+
+    def _demote(self, state: BackendState) -> None:
+        """Move a backend to the end of the ranking."""
+        state.demoted = True
+        self._ranked.remove(state)
+        self._ranked.append(state)
+        logger.warning(
+            f"Demoting window backend {state.name} after "
+            f"{state.consecutive_failures} consecutive failures; "
+            f"now using {self.active}"
+        )
+
+    @staticmethod
+    def _describe(state: BackendState) -> str:
+        """Format a backend's probe result for logging."""
+        if not state.available:
+            return f"{state.name}: unavailable"
+        if not state.working:
+            return f"{state.name}: failed"
+        if state.probe_latency is None:
+            return f"{state.name}: available"
+        return (
+            f"{state.name}: {state.probe_latency * 1000:.1f}ms, "
+            f"{state.probe_window_count} windows"
+        )
+
+    def stats(self) -> dict:
+        """Return the active backend and per-backend timings."""
+        backends = {}
+        for state in self._states:
+            backends[state.name] = {
+                "available": state.available,
+                "working": state.working,
+                "demoted": state.demoted,
+                "probe_latency_ms": (
+                    round(state.probe_latency * 1000, 2)
+                    if state.probe_latency is not None else None
+                ),
+                "calls": state.calls,
+                "failures": state.failures,
+                "avg_latency_ms": (
+                    round(state.total_latency / state.calls * 1000, 2)
+                    if state.calls else None
+                ),
+            }
+        return {"active": self.active, "backends": backends}
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Callable, Optional
 
 
 @dataclass
@@ -10,10 +11,30 @@ class WindowInfo:
 
     title: str
     process_name: str  # Executable name (e.g., "teams", "zoom", "notepad")
+    pid: int = 0  # Owning process ID, 0 if unknown
+
+
+@dataclass
+class Backend:
+    """A single window enumeration method offered by a platform."""
+
+    name: str  # Backend name (e.g., "wmctrl", "pywin32")
+    # Returns the visible windows, or None if enumeration failed
+    get_windows: Callable[[], Optional[list[WindowInfo]]]
+    # Returns True if the tools/APIs this backend needs are present
+    is_available: Callable[[], bool]
 
 
 class Platform(ABC):
-    """Abstract base class for platform-specific window title detection."""
+    """Abstract base class for platform-specific window title detection.
+
+    Subclasses describe their enumeration methods via get_backends(). The
+    backends are probed once, ranked by latency and then managed by a
+    BackendManager that falls back and re-probes as needed.
+    """
+
+    def __init__(self):
+        self._backend_manager = None
 
     @property
     @abstractmethod
@@ -22,18 +43,51 @@ class Platform(ABC):
         pass
 
     @abstractmethod
-    def get_windows(self) -> list[WindowInfo]:
-        """Get a list of all visible windows with their process info.
+    def get_backends(self) -> list[Backend]:
+        """Return the window enumeration backends for this platform.
+
+        Backends are listed in order of preference; the order is used to
+        break ties when probing cannot tell them apart.
 
         Returns:
-            List of WindowInfo objects containing title and process name
+            List of Backend objects
         """
         pass
 
-    def is_available(self) -> bool:
+    @property
+    def backend_manager(self):
+        """Return the BackendManager for this platform, creating it on first use."""
+        if self._backend_manager is None:
+            from .backends import BackendManager
+            self._backend_manager = BackendManager(self.get_backends())
+        return self._backend_manager
+
+    def get_windows(self) -> Optional[list[WindowInfo]]:
+        """Get a list of all visible windows with their process info.
+
+        Returns:
+            List of WindowInfo objects containing title and process name,
+            or None if every backend failed to enumerate windows
+        """
+        return self.backend_manager.get_windows()
+
+    def is_available(self, measure: bool = True) -> bool:
         """Check if this platform implementation is available.
 
+        Probes every backend once and ranks them by latency. Only the
+        presence of the required tools decides availability; a backend
+        whose trial enumeration fails (e.g. X is not up yet at login) is
+        ranked last and retried while polling.
+
+        Args:
+            measure: If False, only check availability and keep preference
+                order, avoiding a trial enumeration per backend
+
         Returns:
-            True if the required tools/APIs are available
+            True if at least one backend's tools are present
         """
-        return True
+        return self.backend_manager.probe(measure=measure)
+
+    def stats(self) -> dict:
+        """Return backend selection and timing statistics."""
+        return self.backend_manager.stats()
@@ -3,12 +3,32 @@
 import os
 import shutil
 import subprocess
-from .base import Platform, WindowInfo
+from typing import Optional
+
+from .base import Backend, Platform, WindowInfo
 
 
 class LinuxPlatform(Platform):
     """Linux implementation using wmctrl or xdotool."""
 
+    def __init__(self, display: Optional[str] = None, xauthority: Optional[str] = None):
+        """Initialize the platform.
+
+        Args:
+            display: X display to enumerate (default: inherit DISPLAY)
+            xauthority: Xauthority file for that display (default: inherit XAUTHORITY)
+        """
+        super().__init__()
+        self.display = display
+        self._env: Optional[dict[str, str]] = None
+        if display:
+            self._env = dict(os.environ, DISPLAY=display)
+            if xauthority:
+                self._env["XAUTHORITY"] = xauthority
+        # Resolved once while probing so polls don't walk PATH
+        self._wmctrl: Optional[str] = None
+        self._xdotool: Optional[str] = None
+
     @property
     def name(self) -> str:
         return "linux"
@@ -31,18 +51,19 @@ class LinuxPlatform(Platform):
             pass
         return ""
 
-    def _get_windows_wmctrl(self) -> list[WindowInfo]:
+    def _get_windows_wmctrl(self) -> Optional[list[WindowInfo]]:
         """Get windows using wmctrl with PID info."""
         try:
             # Use -lp to get PID along with window info
             result = subprocess.run(
-                ["wmctrl", "-lp"],
+                [self._wmctrl or "wmctrl", "-lp"],
                 capture_output=True,
                 text=True,
                 timeout=5,
+                env=self._env,
             )
             if result.returncode != 0:
-                return []
+                return None
 
             windows = []
             for line in result.stdout.strip().split("\n"):
@@ -55,25 +76,28 @@ class LinuxPlatform(Platform):
                         pid = int(parts[2])
                         title = parts[4]
                         process_name = self._get_process_name(pid)
-                        windows.append(WindowInfo(title=title, process_name=process_name))
+                        windows.append(WindowInfo(title=title, process_name=process_name, pid=pid))
                     except (ValueError, IndexError):
                         continue
             return windows
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return []
+            return None
 
-    def _get_windows_xdotool(self) -> list[WindowInfo]:
+    def _get_windows_xdotool(self) -> Optional[list[WindowInfo]]:
         """Get windows using xdotool."""
+        xdotool = self._xdotool or "xdotool"
         try:
             # Get all window IDs
             result = subprocess.run(
-                ["xdotool", "search", "--name", ""],
+                [xdotool, "search", "--name", ""],
                 capture_output=True,
                 text=True,
                 timeout=5,
+                env=self._env,
             )
             if result.returncode != 0:
-                return []
+                # xdotool exits 1 without output when nothing matched
+                return None if result.stderr.strip() else []
 
             window_ids = result.stdout.strip().split("\n")
             windows = []
@@ -84,10 +108,11 @@ class LinuxPlatform(Platform):
                 try:
                     # Get window name
                     name_result = subprocess.run(
-                        ["xdotool", "getwindowname", wid],
+                        [xdotool, "getwindowname", wid],
                         capture_output=True,
                         text=True,
                         timeout=2,
+                        env=self._env,
                     )
                     if name_result.returncode != 0 or not name_result.stdout.strip():
                         continue
@@ -96,12 +121,14 @@ class LinuxPlatform(Platform):
 
                     # Get window PID
                     pid_result = subprocess.run(
-                        ["xdotool", "getwindowpid", wid],
+                        [xdotool, "getwindowpid", wid],
                         capture_output=True,
                         text=True,
                         timeout=2,
+                        env=self._env,
                     )
                     process_name = ""
+                    pid = 0
                     if pid_result.returncode == 0 and pid_result.stdout.strip():
                         try:
                             pid = int(pid_result.stdout.strip())
@@ -109,30 +136,27 @@ class LinuxPlatform(Platform):
                         except ValueError:
                             pass
 
-                    windows.append(WindowInfo(title=title, process_name=process_name))
+                    windows.append(WindowInfo(title=title, process_name=process_name, pid=pid))
                 except subprocess.TimeoutExpired:
                     continue
 
             return windows
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return []
-
-    def get_windows(self) -> list[WindowInfo]:
-        """Get windows with process info, trying multiple methods."""
-        # Try wmctrl first (most reliable for X11)
-        if shutil.which("wmctrl"):
-            windows = self._get_windows_wmctrl()
-            if windows:
-                return windows
-
-        # Fall back to xdotool
-        if shutil.which("xdotool"):
-            windows = self._get_windows_xdotool()
-            if windows:
-                return windows
-
-        return []
-
-    def is_available(self) -> bool:
-        """Check if wmctrl or xdotool is available."""
-        return bool(shutil.which("wmctrl") or shutil.which("xdotool"))
+            return None
+
+    def _has_wmctrl(self) -> bool:
+        """Resolve the wmctrl executable."""
+        self._wmctrl = shutil.which("wmctrl")
+        return self._wmctrl is not None
+
+    def _has_xdotool(self) -> bool:
+        """Resolve the xdotool executable."""
+        self._xdotool = shutil.which("xdotool")
+        return self._xdotool is not None
+
+    def get_backends(self) -> list[Backend]:
+        """Return wmctrl (most reliable for X11) and xdotool backends."""
+        return [
+            Backend("wmctrl", self._get_windows_wmctrl, self._has_wmctrl),
+            Backend("xdotool", self._get_windows_xdotool, self._has_xdotool),
+        ]
@@ -1,7 +1,10 @@
 """macOS window title detection."""
 
+import shutil
 import subprocess
-from .base import Platform, WindowInfo
+from typing import Optional
+
+from .base import Backend, Platform, WindowInfo
 
 
 class MacOSPlatform(Platform):
@@ -11,7 +14,7 @@ class MacOSPlatform(Platform):
     def name(self) -> str:
         return "macos"
 
-    def get_windows(self) -> list[WindowInfo]:
+    def _get_windows_osascript(self) -> Optional[list[WindowInfo]]:
         """Get windows with process info using osascript/AppleScript."""
         # AppleScript that returns process name and window title pairs
         # Format: "process_name|||window_title" separated by ":::"
@@ -40,7 +43,7 @@ class MacOSPlatform(Platform):
                 timeout=10,
             )
             if result.returncode != 0:
-                return []
+                return None
 
             output = result.stdout.strip()
             if not output:
@@ -58,16 +61,12 @@ class MacOSPlatform(Platform):
 
             return windows
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return []
+            return None
 
-    def is_available(self) -> bool:
+    def _has_osascript(self) -> bool:
         """Check if osascript is available (always true on macOS)."""
-        try:
-            result = subprocess.run(
-                ["which", "osascript"],
-                capture_output=True,
-                timeout=5,
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        return shutil.which("osascript") is not None
+
+    def get_backends(self) -> list[Backend]:
+        """Return the AppleScript backend."""
+        return [Backend("osascript", self._get_windows_osascript, self._has_osascript)]
@@ -0,0 +1,94 @@
+"""Wake the poll loop as soon as a meeting application process exits (Linux)."""
+
+import logging
+import os
+import select
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessExitWatcher:
+    """Watch processes through pidfds and report when any of them exits.
+
+    A pidfd becomes readable when its process terminates, so waiting on the
+    watched pidfds instead of sleeping lets the main loop re-evaluate the
+    meeting status immediately after Zoom or Teams quits, without
+    shortening the poll interval.
+    """
+
+    def __init__(self):
+        self._fds: dict[int, int] = {}  # pid -> pidfd
+        # Exited processes whose windows may linger for a moment; re-watching
+        # them would wake the loop again straight away
+        self._exited: set[int] = set()
+        self._supported = self.is_supported()
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check if pidfds are available (Linux 5.3+, Python 3.9+)."""
+        return hasattr(os, "pidfd_open")
+
+    def watch(self, pids: set[int]) -> None:
+        """Watch exactly the given processes.
+
+        Pidfds are opened for newly seen processes and closed for processes
+        that are no longer of interest.
+
+        Args:
+            pids: Process IDs to watch
+        """
+        if not self._supported:
+            return
+
+        for pid in list(self._fds):
+            if pid not in pids:
+                os.close(self._fds.pop(pid))
+        self._exited &= pids
+
+        for pid in pids:
+            if pid in self._fds or pid in self._exited:
+                continue
+            try:
+                self._fds[pid] = os.pidfd_open(pid)
+                logger.debug(f"Watching process {pid} for exit")
+            except ProcessLookupError:
+                # Already gone; the next poll will notice
+                continue
+            except OSError as e:
+                # Kernel without pidfd support or blocked by seccomp
+                logger.warning(f"Process exit watching unavailable: {e}")
+                self._supported = False
+                self.close()
+                return
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep until the timeout elapses or a watched process exits.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if a watched process exited before the timeout
+        """
+        if not self._fds:
+            time.sleep(timeout)
+            return False
+
+        readable, _, _ = select.select(list(self._fds.values()), [], [], timeout)
+        if not readable:
+            return False
+
+        for pid, fd in list(self._fds.items()):
+            if fd in readable:
+                logger.debug(f"Watched process {pid} exited")
+                os.close(self._fds.pop(pid))
+                self._exited.add(pid)
+        return True
+
+    def close(self) -> None:
+        """Close all pidfds."""
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+        self._exited.clear()
@@ -1,23 +1,52 @@
 """Windows window title detection."""
 
+import shutil
 import subprocess
-from .base import Platform, WindowInfo
+from .base import Backend, Platform, WindowInfo
 
 
 class WindowsPlatform(Platform):
     """Windows implementation using pywin32 or PowerShell fallback."""
 
+    def __init__(self):
+        super().__init__()
+        # Imported once while probing so polls don't retry the import path
+        self._win32gui = None
+        self._win32process = None
+        self._psutil = None
+
     @property
     def name(self) -> str:
         return "windows"
 
-    def _get_windows_pywin32(self) -> list[WindowInfo] | None:
-        """Get windows with process info using pywin32."""
+    def _has_pywin32(self) -> bool:
+        """Import pywin32 and psutil, keeping the modules for later polls."""
         try:
             import win32gui
             import win32process
             import psutil
+        except ImportError:
+            return False
+
+        self._win32gui = win32gui
+        self._win32process = win32process
+        self._psutil = psutil
+        return True
 
+    def _has_powershell(self) -> bool:
+        """Check if PowerShell is on PATH."""
+        return shutil.which("powershell") is not None
+
+    def _get_windows_pywin32(self) -> list[WindowInfo] | None:
+        """Get windows with process info using pywin32."""
+        if self._win32gui is None and not self._has_pywin32():
+            return None
+
+        win32gui = self._win32gui
+        win32process = self._win32process
+        psutil = self._psutil
+
+        try:
             windows = []
 
             def enum_callback(hwnd, _):
@@ -31,7 +60,7 @@ class WindowsPlatform(Platform):
                             # Remove .exe extension if present
                             if process_name.endswith(".exe"):
                                 process_name = process_name[:-4]
-                            windows.append(WindowInfo(title=title, process_name=process_name))
+                            windows.append(WindowInfo(title=title, process_name=process_name, pid=pid))
                         except (psutil.NoSuchProcess, psutil.AccessDenied):
                             # If we can't get process info, still include the window
                             windows.append(WindowInfo(title=title, process_name=""))
@@ -39,12 +68,10 @@ class WindowsPlatform(Platform):
 
             win32gui.EnumWindows(enum_callback, None)
             return windows
-        except ImportError:
-            return None
         except Exception:
             return None
 
-    def _get_windows_powershell(self) -> list[WindowInfo]:
+    def _get_windows_powershell(self) -> list[WindowInfo] | None:
         """Get windows with process info using PowerShell (fallback)."""
         ps_script = '''
         Get-Process | Where-Object {$_.MainWindowTitle} | ForEach-Object {
@@ -60,7 +87,7 @@ class WindowsPlatform(Platform):
                 timeout=10,
             )
             if result.returncode != 0:
-                return []
+                return None
 
             windows = []
             for line in result.stdout.strip().split("\n"):
@@ -74,34 +101,11 @@ class WindowsPlatform(Platform):
 
             return windows
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return []
-
-    def get_windows(self) -> list[WindowInfo]:
-        """Get windows with process info, trying pywin32 first, then PowerShell."""
-        # Try pywin32 first (faster and more reliable)
-        windows = self._get_windows_pywin32()
-        if windows is not None:
-            return windows
-
-        # Fall back to PowerShell
-        return self._get_windows_powershell()
-
-    def is_available(self) -> bool:
-        """Check if window enumeration is available."""
-        # pywin32 check
-        try:
-            import win32gui
-            return True
-        except ImportError:
-            pass
+            return None
 
-        # PowerShell fallback check
-        try:
-            result = subprocess.run(
-                ["powershell", "-Command", "echo test"],
-                capture_output=True,
-                timeout=5,
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+    def get_backends(self) -> list[Backend]:
+        """Return pywin32 (faster and more reliable) and PowerShell backends."""
+        return [
+            Backend("pywin32", self._get_windows_pywin32, self._has_pywin32),
+            Backend("powershell", self._get_windows_powershell, self._has_powershell),
+        ]
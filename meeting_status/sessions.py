@@ -0,0 +1,350 @@
+"""Multi-session monitoring: one daemon watching every X session on a host."""
+
+import logging
+import os
+import pwd
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .config import Config
+from .platforms.linux import LinuxPlatform
+
+if TYPE_CHECKING:
+    from .detectors import MeetingDetector
+    from .notifiers import HomeAssistantNotifier
+
+logger = logging.getLogger(__name__)
+
+X11_SOCKET_DIR = "/tmp/.X11-unix"
+LOGIN_DEFS = "/etc/login.defs"
+
+
+@dataclass(frozen=True)
+class XSession:
+    """An X display in use by a user, plus the credentials to access it."""
+
+    user: str
+    uid: int
+    display: str
+    xauthority: Optional[str]
+
+    @property
+    def key(self) -> str:
+        return f"{self.user}@{self.display}"
+
+
+class SessionDiscovery:
+    """Find active X sessions from process environments in /proc.
+
+    Every process's DISPLAY and XAUTHORITY are read once; later scans only
+    read the environment of processes that appeared since the previous
+    scan, so rediscovery stays cheap on hosts with many users. Only login
+    users (UID_MIN..UID_MAX from /etc/login.defs) count, so display
+    manager greeters, root and other system accounts are ignored.
+    """
+
+    def __init__(self):
+        # pid -> (uid, DISPLAY, XAUTHORITY), or None if it has no DISPLAY
+        self._seen: dict[int, Optional[tuple[int, str, Optional[str]]]] = {}
+        self._uid_min, self._uid_max = self._login_uid_range()
+
+    @staticmethod
+    def _login_uid_range() -> tuple[int, int]:
+        """Return the (UID_MIN, UID_MAX) range of login users."""
+        limits = {"UID_MIN": 1000, "UID_MAX": 60000}
+        try:
+            with open(LOGIN_DEFS) as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) >= 2 and parts[0] in limits:
+                        try:
+                            limits[parts[0]] = int(parts[1])
+                        except ValueError:
+                            pass
+        except OSError:
+            pass
+        return limits["UID_MIN"], limits["UID_MAX"]
+
+    @staticmethod
+    def _read_environ(pid: int) -> Optional[tuple[str, Optional[str]]]:
+        """Return (DISPLAY, XAUTHORITY) from a process environment."""
+        try:
+            with open(f"/proc/{pid}/environ", "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        display = None
+        xauthority = None
+        for item in data.split(b"\0"):
+            if item.startswith(b"DISPLAY="):
+                display = item[8:].decode(errors="replace")
+            elif item.startswith(b"XAUTHORITY="):
+                xauthority = item[11:].decode(errors="replace")
+        if not display:
+            return None
+        return display, xauthority
+
+    @staticmethod
+    def _display_is_live(display: str) -> bool:
+        """Check that a local display still has its X server socket."""
+        host, _, number = display.rpartition(":")
+        if host not in ("", "unix"):
+            # Remote/forwarded display; nothing cheap to check
+            return True
+        number = number.split(".", 1)[0]
+        return os.path.exists(os.path.join(X11_SOCKET_DIR, f"X{number}"))
+
+    def discover(self) -> list[XSession]:
+        """Scan /proc and return the active X sessions.
+
+        Returns:
+            One XSession per (user, display) pair
+        """
+        pids = set()
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            pids.add(pid)
+            if pid in self._seen:
+                continue
+
+            info = None
+            env = self._read_environ(pid)
+            if env is not None:
+                try:
+                    info = (entry.stat().st_uid, env[0], env[1])
+                except OSError:
+                    pass
+            self._seen[pid] = info
+
+        # Forget processes that have exited
+        for pid in list(self._seen):
+            if pid not in pids:
+                del self._seen[pid]
+
+        sessions: dict[tuple[int, str], XSession] = {}
+        for info in self._seen.values():
+            if info is None:
+                continue
+            uid, display, xauthority = info
+            if not self._uid_min <= uid <= self._uid_max:
+                continue
+            if (uid, display) in sessions or not self._display_is_live(display):
+                continue
+            try:
+                pw = pwd.getpwuid(uid)
+            except KeyError:
+                continue
+            if not xauthority:
+                default = os.path.join(pw.pw_dir, ".Xauthority")
+                xauthority = default if os.path.exists(default) else None
+            sessions[(uid, display)] = XSession(
+                user=pw.pw_name, uid=uid, display=display, xauthority=xauthority,
+            )
+
+        return list(sessions.values())
+
+
+@dataclass
+class SessionState:
+    """Per-session platform, notification target, state and metrics."""
+
+    session: XSession
+    platform: LinuxPlatform
+    notifier: Optional["HomeAssistantNotifier"]
+    previous_in_meeting: Optional[bool] = None
+    polls: int = 0
+    errors: int = 0
+    notifications: int = 0
+    notify_failures: int = 0
+    consecutive_notify_failures: int = 0
+    retry_after: Optional[float] = None  # Monotonic time of the next attempt after repeated failures
+    last_poll_ms: float = 0.0
+
+    def stats(self) -> dict:
+        """Return this session's state and counters."""
+        return {
+            "in_meeting": self.previous_in_meeting,
+            "backend": self.platform.backend_manager.active,
+            "polls": self.polls,
+            "errors": self.errors,
+            "notifications": self.notifications,
+            "notify_failures": self.notify_failures,
+            "last_poll_ms": round(self.last_poll_ms, 2),
+        }
+
+
+class MultiSessionMonitor:
+    """Poll every discovered X session on a shared thread pool.
+
+    Each session gets its own LinuxPlatform bound to its DISPLAY and
+    XAUTHORITY, and its own Home Assistant script from
+    Config.session_scripts. All notifiers share one HTTP connection pool.
+    A session whose notifications fail NOTIFY_FAILURE_LIMIT times in a row
+    (e.g. its script does not exist) is only retried every
+    NOTIFY_BACKOFF_SECONDS.
+    """
+
+    DISCOVERY_INTERVAL_SECONDS = 30.0
+    NOTIFY_FAILURE_LIMIT = 5
+    NOTIFY_BACKOFF_SECONDS = 300.0
+
+    def __init__(
+        self,
+        config: Config,
+        detectors: list["MeetingDetector"],
+        notifier: Optional["HomeAssistantNotifier"],
+    ):
+        """Initialize the monitor.
+
+        Args:
+            config: Application configuration
+            detectors: Detectors shared by all sessions
+            notifier: Base notifier whose connection pool is shared, or None for dry run
+        """
+        self.config = config
+        self.detectors = detectors
+        self.notifier = notifier
+        self._discovery = SessionDiscovery()
+        self._states: dict[str, SessionState] = {}
+        self._last_discovery: Optional[float] = None
+
+    def refresh_sessions(self) -> None:
+        """Rediscover sessions, adding new ones and dropping ended ones."""
+        current = {s.key: s for s in self._discovery.discover()}
+
+        for key in list(self._states):
+            if key not in current:
+                logger.info(f"Session ended: {key}")
+                self._clear_status(self._states.pop(key))
+
+        for key, session in current.items():
+            if key in self._states:
+                continue
+
+            notifier = None
+            if self.notifier:
+                script = self.config.session_script(session.user)
+                if script is None:
+                    logger.debug(f"No session script for {session.user}, skipping {key}")
+                    continue
+                notifier = self.notifier.for_script(script)
+
+            # Rank backends without timing them; a measured probe per session
+            # would enumerate every session's windows once per backend
+            platform = LinuxPlatform(session.display, session.xauthority)
+            platform.is_available(measure=False)
+            self._states[key] = SessionState(session=session, platform=platform, notifier=notifier)
+            logger.info(f"Session started: {key}")
+
+        self._last_discovery = time.monotonic()
+
+    @staticmethod
+    def _clear_status(state: SessionState) -> None:
+        """Send "not in meeting" for a session that ended during a meeting."""
+        if state.notifier and state.previous_in_meeting:
+            if not state.notifier.notify(False):
+                logger.warning(f"{state.session.key}: Failed to clear status of ended session")
+
+    def _poll_session(self, state: SessionState) -> None:
+        """Enumerate one session's windows and notify on a state change."""
+        start = time.perf_counter()
+        try:
+            windows = state.platform.get_windows()
+            if windows is None:
+                # Keep the previous status rather than report "no meeting"
+                state.errors += 1
+                logger.warning(f"{state.session.key}: Failed to enumerate windows")
+                return
+            in_meeting = any(d.is_in_meeting(windows) for d in self.detectors)
+
+            if in_meeting != state.previous_in_meeting:
+                if state.retry_after is not None and time.monotonic() < state.retry_after:
+                    # This target keeps failing; wait out the back-off
+                    return
+
+                status = "IN MEETING" if in_meeting else "NOT IN MEETING"
+                logger.info(f"{state.session.key}: Status changed: {status}")
+
+                if state.notifier:
+                    if state.notifier.notify(in_meeting):
+                        state.previous_in_meeting = in_meeting
+                        state.notifications += 1
+                        state.consecutive_notify_failures = 0
+                        state.retry_after = None
+                    else:
+                        state.notify_failures += 1
+                        state.consecutive_notify_failures += 1
+                        if state.consecutive_notify_failures >= self.NOTIFY_FAILURE_LIMIT:
+                            state.retry_after = time.monotonic() + self.NOTIFY_BACKOFF_SECONDS
+                            logger.warning(
+                                f"{state.session.key}: {state.consecutive_notify_failures} "
+                                f"notifications failed in a row, retrying in "
+                                f"{self.NOTIFY_BACKOFF_SECONDS:.0f}s"
+                            )
+                        else:
+                            logger.warning(f"{state.session.key}: Failed to send notification, will retry")
+                else:
+                    print(f"[DRY RUN] {state.session.key}: Would send: {status}")
+                    state.previous_in_meeting = in_meeting
+        except Exception as e:
+            state.errors += 1
+            logger.error(f"{state.session.key}: Error polling session: {e}")
+        finally:
+            state.polls += 1
+            state.last_poll_ms = (time.perf_counter() - start) * 1000
+
+    def poll_once(self, executor: ThreadPoolExecutor) -> None:
+        """Poll all sessions once, rediscovering them when due."""
+        if (
+            self._last_discovery is None
+            or time.monotonic() - self._last_discovery >= self.DISCOVERY_INTERVAL_SECONDS
+        ):
+            try:
+                self.refresh_sessions()
+            except Exception as e:
+                # Keep polling the known sessions; retry at the next interval
+                logger.error(f"Error discovering sessions: {e}")
+                self._last_discovery = time.monotonic()
+
+        # Consume the iterator so every poll finishes before returning
+        list(executor.map(self._poll_session, list(self._states.values())))
+
+    def run(
+        self,
+        should_run: Callable[[], bool],
+        once: bool = False,
+        on_cycle: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Poll all sessions until should_run() returns False.
+
+        Args:
+            should_run: Returns False when the daemon should stop
+            once: Poll every session a single time and return
+            on_cycle: Called after every polling cycle
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.config.session_workers,
+            thread_name_prefix="session",
+        ) as executor:
+            while should_run():
+                start = time.monotonic()
+                self.poll_once(executor)
+                logger.debug(
+                    f"Polled {len(self._states)} sessions in "
+                    f"{(time.monotonic() - start) * 1000:.1f}ms"
+                )
+                if once:
+                    break
+                if on_cycle:
+                    on_cycle()
+                elapsed = time.monotonic() - start
+                time.sleep(max(0.0, self.config.poll_interval_seconds - elapsed))
+
+    def stats(self) -> dict:
+        """Return per-session state and metrics."""
+        return {key: state.stats() for key, state in self._states.items()}
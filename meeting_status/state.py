@@ -0,0 +1,143 @@
+"""Persistent record of the last status delivered to Home Assistant."""
+
+import errno
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DeliveredState:
+    """The last status successfully sent to a notification target."""
+
+    in_meeting: bool
+    target: str  # Service URL the status was sent to
+    timestamp: float  # time.time() of the delivery
+
+
+class StateCache:
+    """Small on-disk state file shared by --once runs.
+
+    The file is replaced atomically and all access happens under an
+    exclusive lock, so overlapping cron jobs and login hooks never send
+    the same change twice.
+    """
+
+    # Skip test_connection() before a send if a delivery succeeded this recently
+    CONNECTION_CHECK_INTERVAL_SECONDS = 300
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            path: State file (default: $XDG_CACHE_HOME/meeting_status/state.json)
+        """
+        if path is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            path = Path(cache_home) / "meeting_status" / "state.json"
+        self.path = path
+        self._lock_path = path.with_name(path.name + ".lock")
+        self._lock_file = None
+
+    def acquire(self) -> None:
+        """Take an exclusive lock on the state file.
+
+        The lock is held until release() or process exit, so a whole run
+        (read, detect, send, write) is serialized against other runs.
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._lock_file = open(self._lock_path, "a")
+            if fcntl:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            else:
+                self._lock_msvcrt()
+        except OSError as e:
+            logger.warning(f"Failed to lock state file {self.path}: {e}")
+
+    def _lock_msvcrt(self) -> None:
+        """Lock the first byte of the lock file on Windows, waiting as long as needed."""
+        self._lock_file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError as e:
+                # LK_LOCK gives up after 10 one-second attempts; keep waiting like flock()
+                if e.errno != errno.EDEADLOCK:
+                    raise
+
+    def release(self) -> None:
+        """Release the lock taken by acquire()."""
+        if self._lock_file is not None:
+            if not fcntl:
+                try:
+                    self._lock_file.seek(0)
+                    msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                except OSError:
+                    pass
+            self._lock_file.close()
+            self._lock_file = None
+
+    def load(self, target: str) -> Optional[DeliveredState]:
+        """Read the last delivered state for a target.
+
+        Args:
+            target: Service URL of the current notifier
+
+        Returns:
+            The recorded state, or None if missing, unreadable or for another target
+        """
+        try:
+            with open(self.path) as f:
+                state = DeliveredState(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable state file {self.path}: {e}")
+            return None
+
+        if state.target != target:
+            logger.debug(f"State file is for {state.target}, ignoring")
+            return None
+        return state
+
+    def save(self, state: DeliveredState) -> None:
+        """Atomically replace the state file.
+
+        Args:
+            state: State that was just delivered
+        """
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".state-")
+            with os.fdopen(fd, "w") as f:
+                json.dump(asdict(state), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write state file {self.path}: {e}")
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def is_recent(self, state: DeliveredState) -> bool:
+        """Check if a delivery happened within the connection check interval."""
+        return time.time() - state.timestamp < self.CONNECTION_CHECK_INTERVAL_SECONDS